@@ -1,15 +1,11 @@
 #!/usr/bin/env python3
 
-from functools import reduce
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional
 
 import numpy as np
-from icecream import ic
-from matplotlib.patches import Rectangle
 from skimage import io
 
-import figure_comp.plot_tools as pt
 from figure_comp.load_image import Image, ImageBlank, Label
 
 
@@ -68,6 +64,38 @@ class Pos:
             else:
                 self.image = ImageBlank(self.path, dx, dy)
 
+    @classmethod
+    def _from_fields(
+        cls, x, y, dx, dy, path, label, image, options, template
+    ) -> "Pos":
+        """Build a Pos directly from its fields, without touching the disk.
+
+        Used by ``PosArray`` to create leaf views onto its column arrays.
+        """
+        pos = cls.__new__(cls)
+        pos.x = x
+        pos.y = y
+        pos.dx = dx
+        pos.dy = dy
+        pos.path = path
+        pos.label = label
+        pos.image = image
+        pos.options = options
+        pos.template = template
+        return pos
+
+    @classmethod
+    def tiled(cls, dx, dy, n) -> "PosArray":
+        """Create ``n`` blank leaves of the same size, ready to merge.
+
+        The preferred form over a list of ``Pos`` when feeding
+        ``merge_row``/``merge_col``: the coordinates are built as columns
+        from the start.
+        """
+        return PosArray.from_rows(
+            dx, dy, np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+        )
+
     def append(self, other):
         if not isinstance(other, (Pos, PosArray)):
             raise TypeError("Unable to append non Pos type")
@@ -204,79 +232,228 @@ class Pos:
 
 
 class PosArray(Pos):
-    def __init__(self, arr: Tuple[Pos]):
-        self.arr = arr if arr is not None else []
+    """A flat collection of ``Pos``, stored as a structure of arrays.
+
+    The coordinates are kept in four parallel numpy columns (``_x``, ``_y``,
+    ``_dx``, ``_dy``) so that shifting, rescaling and the min/max reductions
+    act on whole arrays in one numpy call. The per-leaf metadata (path,
+    label, image, options) lives in object columns alongside; iterating the
+    array yields lightweight ``Pos`` views onto the columns.
+    """
+
+    def __init__(self, arr: Optional[List[Pos]] = None):
+        items = [] if arr is None else arr
+        x, y, dx, dy = [], [], [], []
+        meta = []
+        for p in items:
+            if p.is_array:
+                x.append(p._x)
+                y.append(p._y)
+                dx.append(p._dx)
+                dy.append(p._dy)
+                meta += list(p._meta)
+            else:
+                x.append([p.x])
+                y.append([p.y])
+                dx.append([p.dx])
+                dy.append([p.dy])
+                meta.append((p.path, p.label, p.image, p.options, p.template))
+        self._x = _concat_coords(x)
+        self._y = _concat_coords(y)
+        self._dx = _concat_coords(dx)
+        self._dy = _concat_coords(dy)
+        self._meta = _object_column(meta)
+
+    @classmethod
+    def from_arrays(
+        cls, x, y, dx, dy, paths=None, labels=None, options=None
+    ) -> "PosArray":
+        """Build a PosArray directly from parallel coordinate arrays.
+
+        The metadata arguments are optional sequences matched by index.
+        Paths that resolve on disk are loaded and adopt the true image
+        size, as in ``Pos.__init__``; missing or unresolvable entries
+        give template (blank) leaves, mirroring ``Pos(path=None)``.
+        """
+        pos_arr = cls.__new__(cls)
+        pos_arr._x = _coord_column(x)
+        pos_arr._y = _coord_column(y)
+        pos_arr._dx = _coord_column(dx)
+        pos_arr._dy = _coord_column(dy)
+
+        n = pos_arr._x.size
+        meta = []
+        for i in range(n):
+            path = paths[i] if paths is not None else None
+            label = labels[i] if labels is not None else None
+            opts = options[i] if options is not None else None
+            opts = opts if opts is not None else dict()
+            if path is not None and Path(path).exists():
+                path = Path(path)
+                image = Image(path)
+                pos_arr._dx[i] = image.x
+                pos_arr._dy[i] = image.y
+                meta.append((path, label, image, opts, False))
+            else:
+                path = Path(path) if path is not None else Path(".")
+                meta.append((path, label, None, opts, True))
+        pos_arr._meta = _object_column(meta)
+        return pos_arr
+
+    @classmethod
+    def from_rows(cls, x_size, y_size, xs, ys, paths=None) -> "PosArray":
+        """Build a PosArray of uniformly sized leaves at the given positions.
+
+        A convenience over ``from_arrays`` for the row/grid builders: the
+        single size is broadcast to match the positions, so no per-leaf
+        ``Pos`` is ever constructed.
+        """
+        xs = np.asarray(xs)
+        n = xs.size
+        return cls.from_arrays(
+            xs, ys, np.full(n, x_size), np.full(n, y_size), paths=paths
+        )
+
+    def _leaf(self, index: int) -> Pos:
+        """ Create a ``Pos`` view of the leaf at the given index. """
+        path, label, image, options, template = self._meta[index]
+        if image is None:
+            # Lazily create the blank images for template leaves
+            dx, dy = self._dx[index], self._dy[index]
+            image = ImageBlank(path, int(dx), int(dy))
+            self._meta[index] = (path, label, image, options, template)
+        return Pos._from_fields(
+            self._x[index].item(),
+            self._y[index].item(),
+            self._dx[index].item(),
+            self._dy[index].item(),
+            path,
+            label,
+            image,
+            options,
+            template,
+        )
 
     def append(self, other):
-        if isinstance(other, Pos):
-            self.arr.append(other)
+        if isinstance(other, PosArray):
+            self._x = _join_columns(self._x, other._x)
+            self._y = _join_columns(self._y, other._y)
+            self._dx = _join_columns(self._dx, other._dx)
+            self._dy = _join_columns(self._dy, other._dy)
+            self._meta = _object_column(list(self._meta) + list(other._meta))
             return self
-        elif isinstance(other, PosArray):
-            self.arr = self.arr + other.arr
+        elif isinstance(other, Pos):
+            self._x = _join_columns(self._x, np.asarray([other.x]))
+            self._y = _join_columns(self._y, np.asarray([other.y]))
+            self._dx = _join_columns(self._dx, np.asarray([other.dx]))
+            self._dy = _join_columns(self._dy, np.asarray([other.dy]))
+            self._meta = _object_column(
+                list(self._meta)
+                + [(other.path, other.label, other.image, other.options, other.template)]
+            )
             return self
-        if not isinstance(other, (Pos, PosArray)):
-            raise TypeError("Unable to append non Pos type")
+        raise TypeError("Unable to append non Pos type")
 
     def shift_x(self, x_move):
         """ Move all items right by the given amount. """
-        [p.shift_x(x_move) for p in self.arr]
+        self._x = self._x + x_move
 
     def shift_y(self, y_move):
         """ Move all items down by the given amount. """
-        [p.shift_y(y_move) for p in self.arr]
+        self._y = self._y + y_move
+
+    def __iadd__(self, other):
+        """In-place shift by an (x, y) offset — one ufunc call per column.
+
+        Pos arguments keep the stacking behaviour of ``+``.
+        """
+        if isinstance(other, Pos):
+            return self.stack_right(other)
+        x_move, y_move = other
+        self.shift_x(x_move)
+        self.shift_y(y_move)
+        return self
+
+    def __imul__(self, scale):
+        """ In-place rescale without the ``__mul__`` round trip. """
+        self.rescale(scale)
+        return self
+
+    @property
+    def x(self):
+        """ The x coordinate of each leaf in the array. """
+        return self._x
+
+    @property
+    def y(self):
+        """ The y coordinate of each leaf in the array. """
+        return self._y
+
+    @property
+    def dx(self):
+        """ The width of each leaf in the array. """
+        return self._dx
+
+    @property
+    def dy(self):
+        """ The height of each leaf in the array. """
+        return self._dy
 
     @property
     def x_min(self):
         """ The smallest x_coordinate in the array. """
-        return min(map(lambda p: p.x_min, self.arr))
+        return self._x.min()
 
     @property
     def x_max(self):
         """ The largest x_coordinate in the array. """
-        return max(map(lambda p: p.x_max, self.arr))
+        return (self._x + self._dx).max()
 
     @property
     def y_min(self):
         """ The smallest y_coordinate in the array. """
-        return min(map(lambda p: p.y_min, self.arr))
+        return self._y.min()
 
     @property
     def y_max(self):
         """ The largest y_coordinate in the array. """
-        return max(map(lambda p: p.y_max, self.arr))
+        return (self._y + self._dy).max()
+
+    @property
+    def aspect(self):
+        """ The aspect ratio of each leaf in the array. """
+        return self._dx / self._dy
 
     def rescale(self, scale):
         """Rescale all images by a factor.
 
-        The starting points are rescaled as well, about a given point, typically about the
-        minimium of the x positions of the included images.
+        The starting points are rescaled as well, about the minimum of the
+        (x, y) positions of the included images.
         """
-
-        def rescale_pos_arr(pos_arr):
-            for p in pos_arr:
-                if p.is_array:
-                    # Recursively resize a pos array
-                    rescale_pos_arr(p)
-                    continue
-                from_scale_point_x = p.x_min - self.x_min
-                from_scale_point_y = p.y_min - self.y_min
-
-                p.x = self.x_min + from_scale_point_x * scale
-                p.y = self.y_min + from_scale_point_y * scale
-
-                p.rescale(scale)
-
-        rescale_pos_arr(self.arr)
+        x_min = self.x_min
+        y_min = self.y_min
+        self._x = x_min + (self._x - x_min) * scale
+        self._y = y_min + (self._y - y_min) * scale
+        self._dx = self._dx * scale
+        self._dy = self._dy * scale
 
     def __len__(self):
-        return self.arr.__len__()
+        return self._x.size
 
     def __getitem__(self, index):
-        """ Pass indexing to the inner array. """
-        return self.arr[index]
+        """ Index the leaves of the array. """
+        return self._leaf(index)
+
+    def __iter__(self):
+        return (self._leaf(i) for i in range(len(self)))
 
     def sketch(self, save_path="/tmp/outline-sketch.png", label=False):
         """ Plot the sizes in the position array. """
+        # Import here so that matplotlib is only loaded when sketching
+        from matplotlib.patches import Rectangle
+
+        import figure_comp.plot_tools as pt
+
         x_range = self.x_max - self.x_min
         y_range = self.y_max - self.y_min
         aspect = x_range / y_range
@@ -284,26 +461,14 @@ class PosArray(Pos):
 
         rect_kwargs = dict(lw=4, alpha=0.6, ec="black", fc="lightgrey")
 
-        def plot_pos_array(p_array: PosArray, num_offset=0):
-            """ Plot all of the leaves within a PosArray. """
-            for num, p in enumerate(p_array):
-                # If p is a PosArray then pass it again
-                if p.is_array:
-                    num_offset += plot_pos_array(p, num + num_offset)
-                    continue
-
-                #  Else plot the outline of the figure
-                ax.add_patch(Rectangle([p.x, p.y], p.dx, p.dy, **rect_kwargs))
-                if label:
-                    pos = (p.x + p.dx / 2, p.y + p.dy / 2)
-                    if not p.path or label == "short":
-                        ax.annotate(f"{num+num_offset}", pos, ha="center", va="center")
-                    else:
-                        ax.annotate(p.path.stem, pos, ha="center", va="center")
-            # Ensure that we keep track of the final index
-            return num
-
-        plot_pos_array(self)
+        for num, p in enumerate(self):
+            ax.add_patch(Rectangle([p.x, p.y], p.dx, p.dy, **rect_kwargs))
+            if label:
+                pos = (p.x + p.dx / 2, p.y + p.dy / 2)
+                if not p.path or label == "short":
+                    ax.annotate(f"{num}", pos, ha="center", va="center")
+                else:
+                    ax.annotate(p.path.stem, pos, ha="center", va="center")
 
         pad = 0.1
         ax.set_xlim(self.x_min - pad * x_range, self.x_max + pad * x_range)
@@ -313,22 +478,12 @@ class PosArray(Pos):
         pt.save(save_path)
 
     def _normalise_values(self):
-        """ Set the x, y, dx, dy positions in the nested array into integers. """
-
-        def normalise_pos_arr(pos_arr: PosArray, attr: str):
-            """ Convert the given attr into an integer """
-            for p in pos_arr:
-                if p.is_array:
-                    # Recursively parse ``PosArray``s
-                    normalise_pos_arr(p, attr)
-                else:
-                    # Convert the values on a ``Pos``
-                    # The +0.5 rounds the values when they are truncated by int
-                    setattr(p, attr, int(getattr(p, attr) + 0.5))
-            return
-
-        attrs = ["x", "y", "dx", "dy"]
-        [normalise_pos_arr(self.arr, attr) for attr in attrs]
+        """ Set the x, y, dx, dy positions in the array into integers. """
+        # The +0.5 rounds the values when they are truncated by the cast
+        self._x = (self._x + 0.5).astype(np.int64)
+        self._y = (self._y + 0.5).astype(np.int64)
+        self._dx = (self._dx + 0.5).astype(np.int64)
+        self._dy = (self._dy + 0.5).astype(np.int64)
 
     def populate(self, save_path: Path, final_width: Optional[int] = 1500):
         """ Load the images into the structure. """
@@ -341,21 +496,12 @@ class PosArray(Pos):
             raise ValueError("Creating image from array with non-zero starting pos")
 
         im_arr = np.zeros((self.y_range, self.x_range, 4), dtype=np.uint8)
-        index = 0
-
-        def populate_in_array(pos_array: PosArray, im: np.ndarray):
-            nonlocal index
-            for p in pos_array:
-                if p.is_array:
-                    populate_in_array(p, im)
-                    continue
 
-                p.image.resize((p.y_range, p.x_range))
-                p.annotate()
-                im[p.y_min : p.y_max, p.x_min : p.x_max] = p.image.data
-                index = index + 1
+        for p in self:
+            p.image.resize((p.y_range, p.x_range))
+            p.annotate()
+            im_arr[p.y_min : p.y_max, p.x_min : p.x_max] = p.image.data
 
-        populate_in_array(self.arr, im=im_arr)
         io.imsave(save_path, im_arr, check_contrast=False)
 
     def __repr__(self):
@@ -373,19 +519,158 @@ class PosArray(Pos):
         self.rescale(scale_factor)
 
 
-def merge_row(pos_list: List[PosArray]) -> PosArray:
-    """ Merge all of the given `PosArray` into a column. """
+def _coord_column(values) -> np.ndarray:
+    """Convert the values into a coordinate column.
 
-    def merge_func(x, y):
-        return x.stack_right(y)
+    Integer inputs are kept as int64 — half the bandwidth of float64 for
+    the min/max reductions — and are promoted to float64 otherwise. A
+    non-integer shift or rescale promotes the column through the usual
+    numpy rules.
+    """
+    column = np.asarray(values)
+    if np.issubdtype(column.dtype, np.integer):
+        return column.astype(np.int64, copy=False)
+    return column.astype(np.float64, copy=False)
 
-    return reduce(merge_func, pos_list)
 
+def _join_columns(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Concatenate two columns into a buffer allocated at the final size. """
+    out = np.empty(a.size + b.size, dtype=np.result_type(a, b))
+    out[: a.size] = a
+    out[a.size :] = b
+    return out
+
+
+def _concat_coords(parts: List) -> np.ndarray:
+    """ Join the given coordinate lists/arrays into a single column. """
+    if not parts:
+        return np.empty(0, dtype=np.float64)
+    return _coord_column(np.concatenate([np.asarray(p) for p in parts]))
 
-def merge_col(pos_list: List[PosArray]) -> PosArray:
-    """ Merge all of the given `PosArray` into a row. """
 
-    def merge_func(x, y):
-        return x.stack_below(y)
+def _object_column(items: List) -> np.ndarray:
+    """ Pack the given items into an object array without numpy coercion. """
+    column = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        column[i] = item
+    return column
 
-    return reduce(merge_func, pos_list)
+
+def _as_array(pos: Pos) -> PosArray:
+    """ Wrap a bare ``Pos`` into a single element ``PosArray``. """
+    return pos if pos.is_array else PosArray([pos])
+
+
+def _assemble(xs, ys, dxs, dys, meta) -> PosArray:
+    """ Join per-part coordinate columns into a single ``PosArray``. """
+    merged = PosArray.__new__(PosArray)
+    merged._x = _concat_coords(xs)
+    merged._y = _concat_coords(ys)
+    merged._dx = _concat_coords(dxs)
+    merged._dy = _concat_coords(dys)
+    merged._meta = _object_column(meta)
+    return merged
+
+
+def _merge_leaves_row(arr: PosArray) -> PosArray:
+    """Place the leaves of a single ``PosArray`` side by side.
+
+    When every leaf starts on the same baseline the per-leaf scales and
+    offsets are closed-form; the general case falls back to the list
+    merge.
+    """
+    if len(arr) < 2:
+        return arr
+    if np.ptp(arr._y) != 0:
+        return merge_row(list(arr))
+
+    scale = arr._dy[0] / arr._dy
+    widths = arr._dx * scale
+    xs = arr._x[0] + np.cumsum(widths) - widths
+    return _assemble([xs], [arr._y], [widths], [arr._dy * scale], list(arr._meta))
+
+
+def _merge_leaves_col(arr: PosArray) -> PosArray:
+    """ Stack the leaves of a single ``PosArray`` below one another. """
+    if len(arr) < 2:
+        return arr
+    if np.ptp(arr._x) != 0:
+        return merge_col(list(arr))
+
+    scale = arr._dx[0] / arr._dx
+    heights = arr._dy * scale
+    ys = arr._y[0] + np.cumsum(heights) - heights
+    return _assemble([arr._x], [ys], [arr._dx * scale], [heights], list(arr._meta))
+
+
+def merge_row(pos_list: List[PosArray]) -> PosArray:
+    """Merge all of the given `PosArray` into a row.
+
+    Each entry is scaled to the running height of the merged array and
+    placed at its right edge, matching repeated ``stack_right`` calls. The
+    transformed columns are gathered first and joined with one concatenate
+    per coordinate instead of re-allocating at every step. A bare
+    ``PosArray`` argument merges its leaves without any per-leaf loop.
+    """
+    if isinstance(pos_list, PosArray):
+        return _merge_leaves_row(pos_list)
+    parts = [_as_array(p) for p in pos_list]
+    first = parts[0]
+    xs, ys, dxs, dys = [first._x], [first._y], [first._dx], [first._dy]
+    meta = list(first._meta)
+
+    x_max = first.x_max
+    y_min, y_max = first.y_min, first.y_max
+    for part in parts[1:]:
+        scale = (y_max - y_min) / part.y_range
+        x = x_max + (part._x - part.x_min) * scale
+        y = part.y_min + (part._y - part.y_min) * scale
+        dx = part._dx * scale
+        dy = part._dy * scale
+
+        xs.append(x)
+        ys.append(y)
+        dxs.append(dx)
+        dys.append(dy)
+        meta += list(part._meta)
+
+        x_max = max(x_max, (x + dx).max())
+        y_min = min(y_min, y.min())
+        y_max = max(y_max, (y + dy).max())
+
+    return _assemble(xs, ys, dxs, dys, meta)
+
+
+def merge_col(pos_list: List[PosArray]) -> PosArray:
+    """Merge all of the given `PosArray` into a column.
+
+    Each entry is scaled to the running width of the merged array and
+    placed at its bottom edge, matching repeated ``stack_below`` calls.
+    """
+    if isinstance(pos_list, PosArray):
+        return _merge_leaves_col(pos_list)
+    parts = [_as_array(p) for p in pos_list]
+    first = parts[0]
+    xs, ys, dxs, dys = [first._x], [first._y], [first._dx], [first._dy]
+    meta = list(first._meta)
+
+    y_max = first.y_max
+    x_min, x_max = first.x_min, first.x_max
+    for part in parts[1:]:
+        scale = (x_max - x_min) / part.x_range
+        x = part.x_min + (part._x - part.x_min) * scale
+        y = y_max + (part._y - part.y_min) * scale
+        dx = part._dx * scale
+        dy = part._dy * scale
+
+        xs.append(x)
+        ys.append(y)
+        dxs.append(dx)
+        dys.append(dy)
+        meta += list(part._meta)
+
+        y_max = max(y_max, (y + dy).max())
+        x_min = min(x_min, x.min())
+        x_max = max(x_max, (x + dx).max())
+
+    return _assemble(xs, ys, dxs, dys, meta)
@@ -6,7 +6,6 @@ import argh
 
 import figure_comp.load_image as li
 import figure_comp.structure_parse as sp
-from icecream import ic
 
 """ Manager for the figure composer.
 
@@ -2,6 +2,7 @@
 
 """ Handle the resizing and loading of images. """
 
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -10,7 +11,6 @@ import PIL
 from PIL import ImageDraw, ImageFont
 from skimage import io, transform
 from typing import List, Optional, Tuple, Generator
-from icecream import ic
 
 ImData = np.ndarray
 Coordinate = Tuple[float, float]
@@ -44,6 +44,18 @@ class Label:
             raise ValueError(error_msg)
 
 
+@functools.lru_cache(maxsize=32)
+def _read_image(path_str: str) -> ImData:
+    """Read and decode an image, cached on the path.
+
+    The same figure is often loaded several times when it appears in
+    multiple layouts; the decode is a pure function of the path. Callers
+    must not write into the returned array — Image only ever rebinds its
+    ``data``, so sharing is safe there.
+    """
+    return io.imread(path_str)
+
+
 class Image:
     def __init__(self, path: Path):
         self.path: Path = Path(path)
@@ -53,7 +65,7 @@ class Image:
     @staticmethod
     def load(path: Path) -> ImData:
         """ Load the image from disk. """
-        return io.imread(path)
+        return _read_image(str(path))
 
     @property
     def x(self):
@@ -63,6 +75,11 @@ class Image:
     def y(self):
         return self.data.shape[0]
 
+    @property
+    def shape(self):
+        # self.data is already a plain reference, so this is copy-free
+        return self.data.shape
+
     def resize(self, new_size, order=3):
         """ Resize the image. """
         if len(new_size) == 3:
@@ -72,6 +89,10 @@ class Image:
         else:
             raise ValueError(f"Invalid resize shape {new_size}: must be len 2 or 3 ")
 
+        # Skip the interpolation when the image is already the target size
+        if tuple(new_size) == self.data.shape:
+            return
+
         self.data = transform.resize(
             self.data_original, new_size, order=order, preserve_range=True
         )
@@ -109,7 +130,7 @@ class ImageBlank(Image):
         self.x_size: int = x_size
         self.y_size: int = y_size
         # Create a white image, but zero out the alpha channel
-        self.data: ImData = np.ones((y_size, x_size, 4), dtype=np.uint8) * 255
+        self.data: ImData = np.full((y_size, x_size, 4), 255, dtype=np.uint8)
 
     @property
     def x(self):
@@ -120,10 +141,14 @@ class ImageBlank(Image):
         return self.y_size
 
     def resize(self, new_size, order=3):
-        """ Resize the image. """
+        """ Resize the image, reusing the pixel buffer when the shape fits. """
         self.x_size = new_size[0]
         self.y_size = new_size[1]
-        self.data = np.ones((self.y_size, self.x_size, 4), dtype=np.uint8) * 255
+        if self.data.shape == (self.y_size, self.x_size, 4):
+            # Same shape: reset to white in place rather than re-allocating
+            self.data.fill(255)
+        else:
+            self.data = np.full((self.y_size, self.x_size, 4), 255, dtype=np.uint8)
 
 
 def generate_default_label_text(
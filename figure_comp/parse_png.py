@@ -6,7 +6,6 @@ from hachoir.parser import createParser
 from hachoir.metadata import extractMetadata, register
 from typing import List
 from pathlib import Path
-from itertools import chain
 from icecream import ic
 
 from dataclasses import dataclass
@@ -31,7 +30,8 @@ def _get_test_ims() -> List[Path]:
     square_ims = (test_im_dir / "square").glob("*.png")
     rectangle_ims = (test_im_dir / "wide").glob("*.png")
 
-    return chain(square_ims, rectangle_ims)
+    # Sort into a concrete list so the result can be iterated more than once
+    return sorted(square_ims) + sorted(rectangle_ims)
 
 
 def get_im_metadata(im_path: Path):
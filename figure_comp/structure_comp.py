@@ -41,6 +41,12 @@ class _Container:
             """ Resolve the nested containers or pass images through """
             return c.run() if isinstance(c, _Container) else c
 
+        # A bare PosArray already holds its leaves as parallel columns, so
+        # it can go straight to the merge's vectorised fast path without
+        # being unpacked into a python list first
+        if isinstance(self.cont, ct.PosArray):
+            return self.merge_func(self.cont, **self.args)
+
         cont = [activate(c) for c in self.cont]
         return self.merge_func(cont, **self.args)
 
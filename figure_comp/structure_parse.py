@@ -50,43 +50,69 @@ from pathlib import Path
 
 import numpy as np
 import yaml
-from icecream import ic
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - libyaml not built
+    from yaml import SafeLoader as _Loader
 
 from figure_comp.coordinate_tracking import Pos
 from figure_comp.load_image import Label, generate_default_label_text
 from figure_comp.structure_comp import Col, Row, _Container
 
 
-def _read_branch(branch, dry=False, **kwargs):
-    struct = []
-    header = "Row" if "Row" in branch else "Col"
-    header_struct = Row if header == "Row" else Col
+# Map from the yaml header onto the container type
+_HEADER_TBL = {"Row": Row, "Col": Col}
+
 
+def _read_branch(branch, dry=False, **kwargs):
     # Provide defaults for general keywords
     # Overkill for now, but can be expanded later
     defaults = dict(default_labels=None)
     opts = {**defaults, **kwargs}
 
-    for entry in branch[header]:
-        if isinstance(entry, str):
-            struct.append(_parse_path(entry, **opts))
-        elif _is_subbranch(entry):
-            struct.append(_read_branch(entry, dry=dry, **opts))
-        elif isinstance(entry, dict):
-            struct.append(_parse_complex_path(entry, **opts))
-        else:
-            raise ValueError("Unable to parse branch")
-
-    if dry:
-        return (header, struct)
-    return header_struct(struct)
+    def _open_frame(node):
+        header = "Row" if "Row" in node else "Col"
+        return header, iter(node[header]), []
+
+    # Walk the tree with an explicit stack of (header, entry iterator,
+    # children, target slot) frames instead of recursing. Resuming the
+    # parent iterator after a sub-branch finishes keeps the leaves — and
+    # the labels drawn from the shared generator — in document order.
+    root = [None]
+    stack = [(*_open_frame(branch), (root, 0))]
+    while stack:
+        header, entries, struct, slot = stack[-1]
+        descended = False
+        for entry in entries:
+            # The yaml loader only ever yields plain str/dict entries, so
+            # the exact type checks skip the MRO walk in this hot loop
+            if type(entry) is str:
+                struct.append(_parse_path(entry, **opts))
+            elif _is_subbranch(entry):
+                struct.append(None)
+                stack.append((*_open_frame(entry), (struct, len(struct) - 1)))
+                descended = True
+                break
+            elif type(entry) is dict:
+                struct.append(_parse_complex_path(entry, **opts))
+            else:
+                raise ValueError("Unable to parse branch")
+        if descended:
+            continue
+        stack.pop()
+        target, index = slot
+        target[index] = (header, struct) if dry else _HEADER_TBL[header](struct)
+    return root[0]
 
 
 def parse_file(file_path: Path):
     """ Turn the contents of the given file into a nested Row/Col object. """
     try:
+        # The config files only ever hold plain tags, so the (libyaml
+        # backed, where available) safe loader is enough
         with open(file_path, "r") as f:
-            structure_dict = yaml.load(f, Loader=yaml.FullLoader)
+            structure_dict = yaml.load(f, Loader=_Loader)
     except yaml.parser.ParserError:
         print(f"Unable to parse configuration file: {file_path}")
         raise SystemExit(1)
@@ -98,6 +124,76 @@ def parse_file(file_path: Path):
     return parse_yaml(structure_dict)
 
 
+def parse_yaml_stream(text: str, dry=False) -> _Container:
+    """Parse yaml text straight from the loader's event stream.
+
+    A full yaml.load composes a node tree and then constructs the python
+    object graph from it; the config format only ever holds nested lists,
+    mappings and plain scalars, so the events can be folded into the
+    structure directly, saving a pass over the document.
+    """
+    return parse_yaml(_stream_structure(text), dry=dry)
+
+
+# Sentinel marking a mapping frame that is waiting for its next key
+_KEY = object()
+
+
+def _stream_scalar(event):
+    """ Resolve a scalar event to the plain types the config format uses. """
+    value = event.value
+    if event.style:
+        # Quoted or block scalars are always strings; plain style is
+        # reported as None by the python parser but '' by libyaml
+        return value
+    if value in ("", "~", "null"):
+        return None
+    if value in ("true", "True"):
+        return True
+    if value in ("false", "False"):
+        return False
+    for cast in (int, float):
+        try:
+            return cast(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _stream_structure(text: str):
+    """ Fold the yaml event stream into plain lists and dicts. """
+    root = None
+    stack = []
+
+    def emit(value):
+        nonlocal root
+        if not stack:
+            root = value
+        elif type(stack[-1]) is list:
+            stack[-1].append(value)
+        else:
+            # Mapping frame: scalars alternate between key and value
+            frame = stack[-1]
+            if frame["key"] is _KEY:
+                frame["key"] = value
+            else:
+                frame["map"][frame["key"]] = value
+                frame["key"] = _KEY
+
+    for event in yaml.parse(text, Loader=_Loader):
+        if isinstance(event, yaml.ScalarEvent):
+            emit(_stream_scalar(event))
+        elif isinstance(event, yaml.SequenceStartEvent):
+            stack.append([])
+        elif isinstance(event, yaml.SequenceEndEvent):
+            emit(stack.pop())
+        elif isinstance(event, yaml.MappingStartEvent):
+            stack.append({"map": {}, "key": _KEY})
+        elif isinstance(event, yaml.MappingEndEvent):
+            emit(stack.pop()["map"])
+    return root
+
+
 def parse_yaml(structure_dict: dict, dry=False) -> _Container:
     """ Convert the yaml dict into a Row or Col container. """
     # Remove top level list if passed
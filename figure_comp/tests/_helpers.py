@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+""" Shared helpers for building ``PosArray`` fixtures in the tests. """
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+from figure_comp.coordinate_tracking import Pos, PosArray
+
+test_dir = Path(__file__).resolve().parent
+test_im_dir = test_dir / "test_im"
+
+# Cross-process guard for the corpus generation; the corpus directory only
+# ever appears through an atomic rename, so it is either absent or complete
+_LOCK_PATH = test_dir / ".test_im.lock"
+_LOCK_TIMEOUT = 120
+
+
+def _generate_corpus():
+    """ Render the test images into place via a temporary directory. """
+    # Deferred: matplotlib is only needed when the corpus is missing
+    import figure_comp.tests.create_test_figures as ctf
+
+    tmp_dir = test_dir / f"test_im.tmp-{os.getpid()}"
+    tmp_dir.mkdir()
+    try:
+        ctf.create_square_plots(out_dir=tmp_dir)
+        ctf.create_rect_plots(out_dir=tmp_dir)
+        os.rename(tmp_dir, test_im_dir)
+    finally:
+        if tmp_dir.is_dir():
+            shutil.rmtree(tmp_dir)
+
+
+def ensure_test_images():
+    """Create the test image corpus once across parallel workers.
+
+    Workers race for the lock file; the winner renders into a temporary
+    directory and renames it into place atomically, so the others only
+    ever see a missing or a complete corpus — never a half-written one.
+    """
+    deadline = time.monotonic() + _LOCK_TIMEOUT
+    while not test_im_dir.is_dir():
+        try:
+            fd = os.open(_LOCK_PATH, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # Another process holds the lock; poll for the rename
+            if time.monotonic() > deadline:
+                raise RuntimeError("Timed out waiting for the test image corpus")
+            time.sleep(0.2)
+            continue
+        try:
+            if not test_im_dir.is_dir():
+                _generate_corpus()
+        finally:
+            os.close(fd)
+            os.unlink(_LOCK_PATH)
+
+
+def worker_tmp_path(name: str) -> Path:
+    """A /tmp output path unique to this process.
+
+    Keeps tests that write images safe to run in parallel (pytest -n auto)
+    where several workers would otherwise clobber the same file.
+    """
+    return Path("/tmp") / f"{os.getpid()}-{name}"
+
+
+def PBl(dx, dy, x=0, y=0, path=None, options=None) -> Pos:
+    """ Shorthand for creating blank Pos elements. """
+    options = options if options is not None else dict()
+    return Pos(path=path, dx=dx, dy=dy, x=x, y=y, options=options)
+
+
+def create_row_array(x_size=50, num=5, x_offset=0, y_offset=0) -> PosArray:
+    """ Create a simple row of images that are ``x_size`` wide. """
+    x_pos = np.arange(x_offset, x_offset + num * x_size, x_size)
+    return PosArray.from_rows(x_size, x_size, x_pos, np.full(num, y_offset))
+
+
+def create_pos_array(
+    x_size=50, y_size=50, x_num=1, y_num=1, x_offset=0, y_offset=0
+) -> PosArray:
+    """ General creation of PosArray. """
+    x_pos = np.arange(x_offset, x_offset + x_num * x_size, x_size)
+    y_pos = np.arange(y_offset, y_offset + y_num * y_size, y_size)
+
+    xs, ys = np.meshgrid(x_pos, y_pos, indexing="ij")
+    xs, ys = xs.ravel(), ys.ravel()
+    n = xs.size
+
+    return PosArray.from_arrays(
+        xs, ys, np.full(n, x_size), np.full(n, y_size)
+    )
+
+
+def create_pos_array_opts(
+    x_size=50, y_size=50, x_num=1, y_num=1, paths=None, opts=None
+) -> PosArray:
+    """ General creation of PosArray. """
+    x_pos = np.arange(0, x_num * x_size, x_size)
+    y_pos = np.arange(0, y_num * y_size, y_size)
+
+    xs, ys = np.meshgrid(x_pos, y_pos, indexing="ij")
+    xs, ys = xs.ravel(), ys.ravel()
+    n = xs.size
+
+    # Pad the per-image options up to the grid size with None
+    paths_arr = np.empty(n, dtype=object)
+    if paths is not None:
+        paths_arr[: len(paths)] = paths
+    opts_arr = np.empty(n, dtype=object)
+    if opts is not None:
+        opts_arr[: len(opts)] = opts
+
+    return PosArray.from_arrays(
+        xs,
+        ys,
+        np.full(n, x_size),
+        np.full(n, y_size),
+        paths=paths_arr,
+        options=opts_arr,
+    )
+
+
+def get_coords(arr: PosArray, attr: str):
+    """ Get the given coordinates/attribute list from a nested set of ``PosArray``s. """
+    # Fast path: attributes that the PosArray exposes as a vector over leaves
+    if arr.is_array and isinstance(getattr(type(arr), attr, None), property):
+        # tolist converts back to native python scalars (int/float)
+        return np.asarray(getattr(arr, attr)).tolist()
+
+    coord_list = []
+    for p in arr:
+        if p.is_array:
+            coord_list += get_coords(p, attr)
+        else:
+            coord_list.append(getattr(p, attr))
+    return coord_list
+
+
+def get_coords_multi(arr: PosArray, attrs=("x", "y", "dx", "dy")) -> dict:
+    """Get several coordinate lists from a ``PosArray`` in one traversal.
+
+    Fuses what would otherwise be one ``get_coords`` walk per attribute
+    into a single pass over the leaves.
+    """
+    if arr.is_array and all(
+        isinstance(getattr(type(arr), attr, None), property) for attr in attrs
+    ):
+        return {attr: np.asarray(getattr(arr, attr)).tolist() for attr in attrs}
+
+    coords = {attr: [] for attr in attrs}
+    for p in arr:
+        if p.is_array:
+            nested = get_coords_multi(p, attrs)
+            for attr in attrs:
+                coords[attr] += nested[attr]
+        else:
+            for attr in attrs:
+                coords[attr].append(getattr(p, attr))
+    return coords
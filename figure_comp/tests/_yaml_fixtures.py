@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+"""Shared yaml fixtures for the parser tests.
+
+The raw yaml literals live here so any test module can reuse them, and
+``load`` caches the parsed result on the source string: a configuration
+is scanned once per run no matter how many tests read it. Callers that
+mutate the loaded structure must deepcopy it first.
+"""
+
+import functools
+import os
+from pathlib import Path
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - libyaml not built
+    from yaml import SafeLoader as _Loader
+
+test_dir = Path(__file__).resolve().parent
+test_im_dir = test_dir / "test_im"
+
+paths = [
+    test_im_dir / "square-im-1.png",
+    test_im_dir / "square-im-2.png",
+    test_im_dir / "square-im-3.png",
+    test_im_dir / "square-im-4.png",
+    test_im_dir / "square-im-5.png",
+    test_im_dir / "rect-im-1.png",
+    test_im_dir / "rect-im-2.png",
+    test_im_dir / "rect-im-3.png",
+]
+
+# Static structure fixtures for the parsing-only tests. The YAML notation
+# itself is covered by the manual parse test; these feed the equivalent
+# Python structures straight to parse_yaml, keeping the lexer out of tests
+# that only exercise the tree walk.
+SIMPLE_CONFIG = [{"Row": ["/path/one", "/path/two"]}]
+NESTED_CONFIG = [
+    {"Row": ["/path/one", "/path/two", {"Col": ["/path/three", "/path/four"]}]}
+]
+NESTED_DOUBLE_CONFIG = [
+    {
+        "Row": [
+            {"Col": ["/path/one", "/path/two"]},
+            "/path/five",
+            {"Col": ["/path/three", "/path/four"]},
+        ]
+    }
+]
+
+# YAML literals that embed no paths, built once rather than per test method
+MANUAL_SIMPLE_YAML = """
+- Row:
+  - /path/one
+  - /path/two
+  - options:
+     max_size: 20
+     new_size: 45
+"""
+
+TRI_MERGE_YAML = """
+- Row:
+  - 1.png
+  - Col:
+    - 2.png
+    - Row:
+      - 3.png
+      - 4.png
+"""
+
+# The option blocks only embed the module-level image paths, so the path
+# substitution (and Path.__str__) runs once at import rather than per test
+_PATH_MAP = {f"p{i}": os.fspath(p) for i, p in enumerate(paths)}
+
+
+def _fill(template: str) -> str:
+    """ Substitute the precomputed path strings into a yaml template. """
+    return template.format_map(_PATH_MAP)
+
+
+OPTIONS_SIMPLE_YAML = _fill("""
+- Row:
+  - {p0}:
+      text: "a."
+      pos: (0.1, 0.1)
+  - Col:
+    - {p1}
+    - {p2}
+    - Row:
+      - {p3}
+      - {p4}
+""")
+
+GLOBAL_OPTS_YAML = _fill("""
+- Row:
+  - {p0}
+  - Col:
+    - {p1}
+    - {p2}
+    - Row:
+      - {p3}
+      - {p4}
+- Options:
+  - size: 45
+""")
+
+GLOBAL_OVERRIDE_YAML = _fill("""
+- Row:
+  - {p0}
+  - Col:
+    - {p1}: {{size: 10}}
+    - {p2}
+    - Row:
+      - {p3}
+      - {p4}
+- Options:
+  - size: 45
+""")
+
+GLOBAL_LABELS_YAML = _fill("""
+- Row:
+  - {p0}
+  - Col:
+    - {p1}
+    - {p2}
+    - Row:
+      - {p3}
+      - {p4}
+- Options:
+  - default_label: "{{index+1}}."
+  - size: 18
+""")
+
+GLOBAL_LABEL_OVERRIDE_YAML = _fill("""
+- Row:
+  - {p0}
+  - Col:
+    - {p1}
+    - {p2}:
+        text: "A"
+    - Row:
+      - {p3}
+      - {p4}
+- Options:
+  - default_label: "{{index+1}}."
+""")
+
+
+@functools.lru_cache(maxsize=256)
+def load(src: str):
+    """Parse yaml source, cached on the string.
+
+    Loading is a pure function of the source, so repeated loads of the
+    same block skip the scanner entirely. Callers that mutate the result
+    must deepcopy it first; everything else can share the object.
+
+    Driving the loader directly skips the yaml.load wrapper; cache misses
+    pay only for the loader construction itself.
+    """
+    loader = _Loader(src)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+
+""" Session setup shared by every test module. """
+
+import pytest
+
+from figure_comp.tests._helpers import ensure_test_images
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_image_corpus():
+    """ The modules read the generated images, so build the corpus up front. """
+    ensure_test_images()
@@ -20,7 +20,7 @@ annotate_kwargs = dict(
 )
 
 
-def create_square_plots(fig_width: float = 4.0):
+def create_square_plots(fig_width: float = 4.0, out_dir: Path = test_im_dir):
     """ Create four square plots """
     rc("font", family=r"serif", size=10)
     # Example hist plot
@@ -31,7 +31,7 @@ def create_square_plots(fig_width: float = 4.0):
     ax.set_ylabel("Count")
     ax.set_xlabel("Position")
     ax.annotate(1, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "square-im-1.png")
+    pt.save_figure_and_trim(out_dir / "square-im-1.png")
 
     fig, ax = pt.create_axes(1, fig_width=fig_width)
     x_scale = np.linspace(0, 4 * np.pi, 200)
@@ -42,7 +42,7 @@ def create_square_plots(fig_width: float = 4.0):
     ax.set_ylabel("Amplitidue")
     ax.set_xlabel("Time")
     ax.annotate(2, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "square-im-2.png")
+    pt.save_figure_and_trim(out_dir / "square-im-2.png")
 
     fig, ax = pt.create_axes(1, fig_width=fig_width)
     x_scale = np.linspace(0, 4 * np.pi, 200)
@@ -53,7 +53,7 @@ def create_square_plots(fig_width: float = 4.0):
     ax.set_ylabel("Amplitidue")
     ax.set_xlabel("Time")
     ax.annotate(3, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "square-im-3.png")
+    pt.save_figure_and_trim(out_dir / "square-im-3.png")
 
     fig, ax = pt.create_axes(
         1, fig_width=fig_width, subplot_kw=dict(projection="polar")
@@ -62,7 +62,7 @@ def create_square_plots(fig_width: float = 4.0):
     y_scale = 1.0 + np.sin(4 * x_scale) * 0.2
     ax.plot(x_scale, y_scale, "g--")
     ax.annotate(4, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "square-im-4.png", despine=False)
+    pt.save_figure_and_trim(out_dir / "square-im-4.png", despine=False)
 
     fig, ax = pt.create_axes(
         1, fig_width=fig_width, subplot_kw=dict(projection="polar")
@@ -71,10 +71,10 @@ def create_square_plots(fig_width: float = 4.0):
     y_scale = 1.0 + np.sin(6 * x_scale) * 0.2
     ax.plot(x_scale, y_scale, "m-")
     ax.annotate(5, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "square-im-5.png", despine=False)
+    pt.save_figure_and_trim(out_dir / "square-im-5.png", despine=False)
 
 
-def create_rect_plots(fig_width: float = 4.0):
+def create_rect_plots(fig_width: float = 4.0, out_dir: Path = test_im_dir):
     """ Create four square plots """
     rc("font", family=r"serif", size=10)
     # Example hist plot
@@ -85,7 +85,7 @@ def create_rect_plots(fig_width: float = 4.0):
     ax.set_ylabel("Count")
     ax.set_xlabel("Position")
     ax.annotate(1, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "rect-im-1.png")
+    pt.save_figure_and_trim(out_dir / "rect-im-1.png")
 
     fig, ax = pt.create_axes(1, fig_width=fig_width, aspect=2.0)
     x_scale = np.linspace(0, 4 * np.pi, 200)
@@ -96,7 +96,7 @@ def create_rect_plots(fig_width: float = 4.0):
     ax.set_ylabel("Amplitidue")
     ax.set_xlabel("Time")
     ax.annotate(2, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "rect-im-2.png")
+    pt.save_figure_and_trim(out_dir / "rect-im-2.png")
 
     fig, ax = pt.create_axes(1, fig_width=fig_width, aspect=2.0)
     x_scale = np.linspace(0, 4 * np.pi, 200)
@@ -107,7 +107,7 @@ def create_rect_plots(fig_width: float = 4.0):
     ax.set_ylabel("Amplitidue")
     ax.set_xlabel("Time")
     ax.annotate(3, **annotate_kwargs)
-    pt.save_figure_and_trim(test_im_dir / "rect-im-3.png")
+    pt.save_figure_and_trim(out_dir / "rect-im-3.png")
 
 
 if __name__ == "__main__":
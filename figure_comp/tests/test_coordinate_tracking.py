@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-import itertools
+import functools
 import unittest
 from pathlib import Path
 
@@ -10,66 +10,31 @@ from numpy.testing import assert_allclose
 from figure_comp.load_image import Label
 from figure_comp.coordinate_tracking import Pos, PosArray
 import figure_comp.coordinate_tracking as ct
+from figure_comp.tests._helpers import (
+    PBl,
+    create_pos_array,
+    create_pos_array_opts,
+    create_row_array,
+    get_coords,
+    worker_tmp_path,
+)
 
 test_dir = Path(__file__).resolve().parent
 test_im_dir = test_dir / "test_im"
 
+# Constant expected coordinates, built once as float arrays so that
+# assert_allclose does not convert a fresh list on every assert
+_SIZE_EXPECTED_MERGED = np.array([50.0, 50.0, 100.0])
 
-def PBl(dx, dy, x=0, y=0, path=None, options=None) -> Pos:
-    """ Shorthand for creating blank Pos elements. """
-    options = options if options is not None else dict()
-    return Pos(path=path, dx=dx, dy=dy, x=x, y=y, options=options)
 
+@functools.lru_cache(maxsize=32)
+def _cached_pos_array(kwargs_items) -> PosArray:
+    """Memoize PosArray fixtures keyed on the creation kwargs.
 
-def create_row_array(x_size=50, num=5, x_offset=0, y_offset=0) -> PosArray:
-    """ Create a simple row of images that are ``x_size`` wide. """
-    x_pos = np.arange(0, num) * x_size + x_offset
-    pos_arr = PosArray([PBl(x_size, x_size, x, y_offset, path=None) for x in x_pos])
-    return pos_arr
-
-
-def create_pos_array(
-    x_size=50, y_size=50, x_num=1, y_num=1, x_offset=0, y_offset=0
-) -> PosArray:
-    """ General creation of PosArray. """
-    x_pos = np.arange(0, x_num) * x_size + x_offset
-    y_pos = np.arange(0, y_num) * y_size + y_offset
-    pos_arr = PosArray(
-        [
-            PBl(x_size, y_size, x, y, path=None)
-            for x, y in itertools.product(x_pos, y_pos)
-        ]
-    )
-    return pos_arr
-
-
-def create_pos_array_opts(
-    x_size=50, y_size=50, x_num=1, y_num=1, paths=None, opts=None
-) -> PosArray:
-    """ General creation of PosArray. """
-    x_pos = np.arange(0, x_num) * x_size
-    y_pos = np.arange(0, y_num) * y_size
-
-    paths = [] if paths is None else paths
-    opts = {} if opts is None else opts
-    x_y_prod = itertools.product(x_pos, y_pos)
-    full_iter = itertools.zip_longest(x_y_prod, paths, opts)
-
-    pos_arr = PosArray(
-        [PBl(x_size, y_size, x, y, path, opts) for (x, y), path, opts in full_iter]
-    )
-    return pos_arr
-
-
-def get_coords(arr: PosArray, attr: str):
-    """ Get the given coordinates/attribute list from a nested set of ``PosArray``s. """
-    coord_list = []
-    for p in arr:
-        if p.is_array:
-            coord_list += get_coords(p, attr)
-        else:
-            coord_list.append(getattr(p, attr))
-    return coord_list
+    Only safe for tests that read the array; anything that shifts or
+    rescales must build its own copy.
+    """
+    return create_pos_array(**dict(kwargs_items))
 
 
 class TestCreatePos(unittest.TestCase):
@@ -77,7 +42,8 @@ class TestCreatePos(unittest.TestCase):
 
     def validate_pos_array(self, func_kwargs, len_expected, shape_expected):
         """ Test the properties of the generated PosArray. """
-        pos_arr = create_pos_array(**func_kwargs)
+        # These tests only read the array, so a cached fixture is safe
+        pos_arr = _cached_pos_array(tuple(sorted(func_kwargs.items())))
 
         x_min_test = pos_arr.x_min
         y_min_test = pos_arr.y_min
@@ -129,7 +95,7 @@ class TestScaling(unittest.TestCase):
         pos_arr.shift_x(x_move)
 
         x_expected = np.arange(0, count) * x_size + x_move
-        x_test = [p.x for p in pos_arr]
+        x_test = pos_arr.x
 
         assert_allclose(x_test, x_expected)
 
@@ -143,7 +109,7 @@ class TestScaling(unittest.TestCase):
         pos_arr.shift_x(x_move)
 
         x_expected = np.arange(0, count) * x_size + x_move * 2
-        x_test = [p.x for p in pos_arr]
+        x_test = pos_arr.x
 
         assert_allclose(x_test, x_expected)
 
@@ -157,19 +123,19 @@ class TestScaling(unittest.TestCase):
 
         # Start pos in the x direction should also be affected
         x_expected = np.arange(0, count) * x_size * scale_factor
-        x_test = [p.x for p in pos_arr]
+        x_test = pos_arr.x
         assert_allclose(x_test, x_expected)
 
         # Y starting pos should still be zero
-        y_expected = x_expected * 0
-        y_test = [p.y for p in pos_arr]
+        y_expected = np.zeros(count)
+        y_test = pos_arr.y
         assert_allclose(y_test, y_expected)
 
         # Ensure the others are as we expect
         dx_expected = x_size * scale_factor
         dy_expected = x_size * scale_factor
-        dx_test = [p.dx for p in pos_arr]
-        dy_test = [p.dy for p in pos_arr]
+        dx_test = pos_arr.dx
+        dy_test = pos_arr.dy
 
         assert_allclose(dx_test, dx_expected)
         assert_allclose(dy_test, dy_expected)
@@ -185,19 +151,19 @@ class TestScaling(unittest.TestCase):
 
         # Start pos in the x direction should also be affected
         x_expected = np.arange(0, count) * x_size * scale_factor + x_offset
-        x_test = [p.x for p in pos_arr]
+        x_test = pos_arr.x
         assert_allclose(x_test, x_expected)
 
         # Y starting pos should still be zero
-        y_expected = x_expected * 0
-        y_test = [p.y for p in pos_arr]
+        y_expected = np.zeros(count)
+        y_test = pos_arr.y
         assert_allclose(y_test, y_expected)
 
         # Ensure the others are as we expect
         dx_expected = x_size * scale_factor
         dy_expected = x_size * scale_factor
-        dx_test = [p.dx for p in pos_arr]
-        dy_test = [p.dy for p in pos_arr]
+        dx_test = pos_arr.dx
+        dy_test = pos_arr.dy
 
         assert_allclose(dx_test, dx_expected)
         assert_allclose(dy_test, dy_expected)
@@ -337,7 +303,7 @@ class TestStackingIrregular(unittest.TestCase):
         pos_arr = create_pos_array(x_size, y_size, y_num=count)
 
         x_test = get_coords(pos_arr, "x")
-        x_expected = np.arange(count) * 0
+        x_expected = np.zeros(count)
         assert_allclose(x_test, x_expected)
 
         y_test = get_coords(pos_arr, "y")
@@ -372,7 +338,7 @@ class TestStackingIrregular(unittest.TestCase):
         total_height_expected = y_one_size * count_one
         self.assertEqual(total_height_test, total_height_expected)
 
-        aspect_test = get_coords(pos_arr, "aspect")
+        aspect_test = pos_arr.aspect
         aspect_expected = [aspect_one] * count_one + [aspect_two] * count_two
         assert_allclose(aspect_test, aspect_expected)
 
@@ -409,33 +375,31 @@ class TestPosCombine(unittest.TestCase):
     def test_pos_comp_row(self):
         """ Merging of multiple pos into a row. """
         count_row = 3
-        positions = [PBl(50, 50) for i in range(count_row)]
-        pos_arr = ct.merge_row(positions)
+        pos_arr = ct.merge_row(Pos.tiled(50, 50, count_row))
 
         len_test = len(pos_arr)
         len_expected = count_row
         self.assertEqual(len_test, len_expected)
 
         pos_expected = np.arange(count_row) * 50
-        pos_test = [p.x for p in pos_arr]
+        pos_test = pos_arr.x
         assert_allclose(pos_test, pos_expected)
 
     def test_pos_comp_col(self):
         """ Merging of multiple pos into a col. """
         count_row = 3
-        positions = [PBl(50, 50) for i in range(count_row)]
-        pos_arr = ct.merge_col(positions)
+        pos_arr = ct.merge_col(Pos.tiled(50, 50, count_row))
 
         len_test = len(pos_arr)
         len_expected = count_row
         self.assertEqual(len_test, len_expected)
 
         pos_expected = np.arange(count_row) * 50
-        pos_test = [p.y for p in pos_arr]
+        pos_test = pos_arr.y
         assert_allclose(pos_test, pos_expected)
 
-        pos_expected = np.arange(count_row) * 0
-        pos_test = [p.x for p in pos_arr]
+        pos_expected = np.zeros(count_row)
+        pos_test = pos_arr.x
         assert_allclose(pos_test, pos_expected)
 
     def test_pos_comp_merged(self):
@@ -450,13 +414,8 @@ class TestPosCombine(unittest.TestCase):
         len_expected = count_row
         self.assertEqual(len_test, len_expected)
 
-        pos_expected = [50, 50, 100]
-        pos_test = [p.dy for p in pos_arr]
-        assert_allclose(pos_test, pos_expected)
-
-        pos_expected = [50, 50, 100]
-        pos_test = [p.dx for p in pos_arr]
-        assert_allclose(pos_test, pos_expected)
+        assert_allclose(pos_arr.dy, _SIZE_EXPECTED_MERGED)
+        assert_allclose(pos_arr.dx, _SIZE_EXPECTED_MERGED)
 
     def test_tri_array_merge(self):
         """ Investigate rescaling of nested PosArray """
@@ -511,11 +470,11 @@ class TestPosCombine(unittest.TestCase):
         self.assertEqual(len_test, len_expected)
 
         pos_expected = [50, 50, 100, 50 * 3 / 2]
-        pos_test = [p.dy for p in pos_arr]
+        pos_test = pos_arr.dy
         assert_allclose(pos_test, pos_expected)
 
         pos_expected = [50, 50, 100, 100 * 3 / 2]
-        pos_test = [p.dx for p in pos_arr]
+        pos_test = pos_arr.dx
         assert_allclose(pos_test, pos_expected)
 
 
@@ -588,9 +547,10 @@ class TestAnnonate(unittest.TestCase):
         pos = Pos("None", label, 500, 500)
         pos.annotate()
 
-        # Test that there are darker text areas
-        flattened = pos.image.data[..., :3].mean(axis=-1)
-        n_black_pixels = (flattened < 10).sum()
+        # Test that there are darker text areas; the threshold on the raw
+        # uint8 channels avoids promoting the whole image to float
+        rgb = pos.image.data[..., :3]
+        n_black_pixels = np.count_nonzero((rgb < 10).all(axis=-1))
 
         self.assertGreater(n_black_pixels, 50, msg="Not enough black/text pixels")
         self.assertLess(n_black_pixels, 5000, msg="Too many black/text pixels")
@@ -604,7 +564,7 @@ class TestAnnonate(unittest.TestCase):
         pos_arr += Pos(path=test_im_dir / "square-im-2.png", label=labels[1])
 
         pos_arr._normalise_values()
-        pos_arr.populate("/tmp/merged-annotate.png", final_width=1200)
+        pos_arr.populate(worker_tmp_path("merged-annotate.png"), final_width=1200)
 
 
 if __name__ == "__main__":
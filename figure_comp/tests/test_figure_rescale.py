@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-import itertools
+import functools
+import os
 import unittest
 from pathlib import Path
 from typing import List
@@ -8,18 +9,25 @@ from typing import List
 import numpy as np
 
 import figure_comp.figure_rescale as fr
-import figure_comp.tests.create_test_figures as ctf
+from figure_comp.tests._helpers import ensure_test_images, worker_tmp_path
+
+# Debug images are written only when requested from the environment
+_SAVE = bool(os.environ.get("FIGCOMP_SAVE_DEBUG"))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_once() -> tuple:
+    """ Load the test images once and share them across the test classes. """
+    return tuple(fr.load_images(_get_test_ims()))
 
 
 def setUpModule():
-    """ Create test images if they do not exist. """
-    project_dir = Path(__file__).resolve().parents[1]
-    test_im_dir = project_dir / "tests/test_im/"
+    """Create the test images if they do not exist.
 
-    if not test_im_dir.is_dir():
-        test_im_dir.mkdir(parents=True)
-        ctf.create_square_plots()
-        ctf.create_rect_plots()
+    Under pytest the session fixture in conftest.py has already done
+    this; the hook keeps plain unittest runs working.
+    """
+    ensure_test_images()
 
 
 class Test_Padding(unittest.TestCase):
@@ -44,17 +52,16 @@ class Test_Padding(unittest.TestCase):
 class TestRowMerge(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        """ Load the test images. """
-        image_paths = _get_test_ims()
-        cls.images = fr.load_images(image_paths)
-        cls.save = False
+        """ Load the shared test images. """
+        cls.images = _load_once()
+        cls.save = _SAVE
 
     def test_pad_addition(self):
         """ Test adding of multiple images in a row. """
         sub_images = self.images[:3]
         merged_fig = fr.merge_row_pad(sub_images, pad_mode="edge")
         if self.save:
-            merged_fig.save()
+            merged_fig.save(worker_tmp_path("test-pad-row.png"))
 
         total_width = sum([i.x for i in sub_images])
         total_height = max([i.y for i in sub_images])
@@ -69,8 +76,8 @@ class TestRowMerge(unittest.TestCase):
         y_size = 1000
 
         merged_fig = fr.merge_row_scale(sub_images, y_size=y_size)
-        if False:
-            merged_fig.save("/tmp/test-rescale-row.png")
+        if self.save:
+            merged_fig.save(worker_tmp_path("test-rescale-row.png"))
 
         total_width = sum([int(i.aspect * y_size) for i in sub_images])
         total_height = y_size
@@ -83,17 +90,16 @@ class TestRowMerge(unittest.TestCase):
 class TestColMerge(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        """ Load the test images. """
-        image_paths = _get_test_ims()
-        cls.images = fr.load_images(image_paths)
-        cls.save = False
+        """ Load the shared test images. """
+        cls.images = _load_once()
+        cls.save = _SAVE
 
     def test_pad_addition(self):
         """ Test adding of multiple images in a column. """
         sub_images = self.images[:3]
         merged_fig = fr.merge_col_pad(sub_images, pad_mode="edge")
         if self.save:
-            merged_fig.save()
+            merged_fig.save(worker_tmp_path("test-pad-col.png"))
 
         total_width = max([i.x for i in sub_images])
         total_height = sum([i.y for i in sub_images])
@@ -109,7 +115,7 @@ class TestColMerge(unittest.TestCase):
 
         merged_fig = fr.merge_col_scale(sub_images, x_size=x_size)
         if self.save:
-            merged_fig.save("/tmp/test-rescale-col.png")
+            merged_fig.save(worker_tmp_path("test-rescale-col.png"))
 
         total_width = x_size
         total_height = sum([int(x_size / i.aspect) for i in sub_images])
@@ -122,10 +128,9 @@ class TestColMerge(unittest.TestCase):
 class TestDualMerge(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        """ Load the test images. """
-        image_paths = _get_test_ims()
-        cls.images = fr.load_images(image_paths)
-        cls.save = False
+        """ Load the shared test images. """
+        cls.images = _load_once()
+        cls.save = _SAVE
 
     def test_pad_addition(self):
         """ Test adding of two rows into a grid. """
@@ -136,7 +141,7 @@ class TestDualMerge(unittest.TestCase):
 
         merged_fig = fr.merge_col_pad([first_row, second_row], pad_mode="edge")
         if self.save:
-            merged_fig.save("/tmp/test-dual-col-pad.png")
+            merged_fig.save(worker_tmp_path("test-dual-col-pad.png"))
 
         total_width = max([i.x for i in [first_row, second_row]])
         total_height = sum([i.y for i in [first_row, second_row]])
@@ -159,7 +164,7 @@ class TestDualMerge(unittest.TestCase):
 
         merged_fig = fr.merge_col_scale([first_row, second_row], x_size=x_size)
         if self.save:
-            merged_fig.save("/tmp/test-dual-col-scale.png")
+            merged_fig.save(worker_tmp_path("test-dual-col-scale.png"))
 
         shape_expected = (total_height, total_width, 4)
 
@@ -184,7 +189,7 @@ class TestDualMerge(unittest.TestCase):
         total_height = sum([(x_size / i.aspect) for i in sub_images[:3]]) / 2
 
         if self.save:
-            merged_fig.save("/tmp/test-dual-col-scale-short.png")
+            merged_fig.save(worker_tmp_path("test-dual-col-scale-short.png"))
 
         shape_expected = (total_height, total_width, 4)
 
@@ -192,6 +197,58 @@ class TestDualMerge(unittest.TestCase):
         np.testing.assert_allclose(shape_test, shape_expected, rtol=0.05)
 
 
+# Cases for _get_new_dimensions: (old_dims, target kwargs, expected shape,
+# expected scale). Grow from x, shrink from y (truncating the computed
+# axis), grow from y and shrink from x.
+_DIM_CASES = [
+    ((500, 500), dict(new_x=1000), (1000, 1000), 2.0),
+    ((1000, 3000), dict(new_y=333), (333, 999), 0.333),
+    ((200, 100), dict(new_y=500), (500, 250), 2.5),
+    ((200, 100), dict(new_x=50), (100, 50), 0.5),
+]
+
+
+class Test_get_new_dimensions(unittest.TestCase):
+    """ Test the aspect-preserving dimension calculations. """
+
+    def _assert_dim_result(self, result, shape_expected, scale_expected):
+        """Check a (dims, scale) pair from _get_new_dimensions.
+
+        The dimensions are exact integers so are compared with
+        assert_array_equal; the scale factor is a float ratio and is
+        compared with allclose.
+        """
+        dims_test, scale_test = result
+        np.testing.assert_array_equal(dims_test, shape_expected)
+        np.testing.assert_allclose(scale_test, scale_expected, rtol=1e-2)
+
+    def test_all_cases(self):
+        """ Run the tabulated dimension cases, one subTest each. """
+        for old_dims, target, shape_expected, scale_expected in _DIM_CASES:
+            with self.subTest(old=old_dims, **target):
+                result = fr._get_new_dimensions(old_dims, **target)
+                self._assert_dim_result(result, shape_expected, scale_expected)
+
+    def test_both_axes_rejected(self):
+        """ Giving both target dimensions is ambiguous. """
+        with self.assertRaises(ValueError):
+            fr._get_new_dimensions((500, 500), new_x=100, new_y=100)
+
+    def test_no_axes_rejected(self):
+        """ At least one target dimension is needed. """
+        with self.assertRaises(ValueError):
+            fr._get_new_dimensions((500, 500))
+
+    def test_batch_matches_scalar(self):
+        """ The batch variant gives the same result as the scalar loop. """
+        old_dims = np.array([(500, 500), (1000, 3000), (200, 100)])
+        dims_test, scale_test = fr._get_new_dimensions_batch(old_dims, new_y=400)
+
+        for old, dims, scale in zip(old_dims, dims_test, scale_test):
+            dims_expected, scale_expected = fr._get_new_dimensions(old, new_y=400)
+            self._assert_dim_result((dims, scale), dims_expected, scale_expected)
+
+
 def _get_test_ims() -> List[Path]:
     """ Get a sample of images from the test directories. """
     project_dir = Path(__file__).resolve().parents[1]
@@ -200,7 +257,9 @@ def _get_test_ims() -> List[Path]:
     square_ims = test_im_dir.glob("square-im*.png")
     rectangle_ims = test_im_dir.glob("rect-im*.png")
 
-    return itertools.chain(square_ims, rectangle_ims)
+    # Sort into a concrete list: a bare chain of generators is exhausted by
+    # the first caller, and the glob order is not stable between runs
+    return sorted(square_ims) + sorted(rectangle_ims)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+""" Test the assembly of Row/Col containers into position arrays. """
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+from figure_comp.coordinate_tracking import Pos
+from figure_comp.structure_comp import Col, Row
+from figure_comp.tests._helpers import PBl
+
+
+class TestSimpleLayout(unittest.TestCase):
+    """ Geometry of flat rows and columns. """
+
+    n_repeats = 3
+
+    @classmethod
+    def setUpClass(cls):
+        """ Build the shared leaves once; the merges never mutate them. """
+        # Pos.tiled builds the leaves as columns in one shot
+        cls.tiles = Pos.tiled(50, 50, cls.n_repeats)
+        cls.rect_leaves = [PBl(100, 50), PBl(50, 50)]
+        # The expected offsets along the packed axis, computed once
+        cls.steps = np.arange(cls.n_repeats) * 50
+
+    def test_simple_row(self):
+        """ Three equal squares merge into a row. """
+        n_repeats = self.n_repeats
+        pos_arr = Row(self.tiles).run()
+
+        # broadcast_to gives zero-copy constant views; the asserts only read
+        assert_allclose(pos_arr.x, self.steps)
+        assert_allclose(pos_arr.y, np.broadcast_to(0, n_repeats))
+        assert_allclose(pos_arr.dx, np.broadcast_to(50, n_repeats))
+        assert_allclose(pos_arr.dy, np.broadcast_to(50, n_repeats))
+
+    def test_simple_col(self):
+        """ Three equal squares merge into a column. """
+        n_repeats = self.n_repeats
+        pos_arr = Col(self.tiles).run()
+
+        assert_allclose(pos_arr.x, np.broadcast_to(0, n_repeats))
+        assert_allclose(pos_arr.y, self.steps)
+
+    def test_rect_row(self):
+        """ A wide and a square image share the row baseline. """
+        pos_arr = Row(self.rect_leaves).run()
+
+        assert_allclose(pos_arr.x, [0, 100])
+        assert_allclose(pos_arr.dx, [100, 50])
+        assert_allclose(pos_arr.dy, [50, 50])
+
+
+class TestNestedLayout(unittest.TestCase):
+    """ Geometry of containers within containers. """
+
+    @classmethod
+    def setUpClass(cls):
+        """ One pool of square leaves shared by every nesting test. """
+        cls.squares = [PBl(50, 50) for _ in range(4)]
+
+    def test_dual_row(self):
+        """ A column nested in a row scales the lone image to match. """
+        first, second, third = self.squares[:3]
+        pos_arr = Row([Col([first, second]), third]).run()
+
+        assert_allclose(pos_arr.x, [0, 0, 50])
+        assert_allclose(pos_arr.y, [0, 50, 0])
+        assert_allclose(pos_arr.dx, [50, 50, 100])
+        assert_allclose(pos_arr.dy, [50, 50, 100])
+
+    def test_double_merge(self):
+        """ Two columns merged through an outer row stay balanced. """
+        left = Col(self.squares[:2])
+        right = Col(self.squares[2:])
+        pos_arr = Row([left, right]).run()
+
+        assert_allclose(pos_arr.x, [0, 0, 50, 50])
+        assert_allclose(pos_arr.y, [0, 50, 0, 50])
+        assert_allclose(pos_arr.dy, np.broadcast_to(50, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,49 +1,93 @@
 #!/usr/bin/env python3
 
+import copy
+import functools
 import unittest
 from pathlib import Path
 
 import numpy as np
-import yaml
-from icecream import ic
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 
 import figure_comp.coordinate_tracking as ct
 import figure_comp.structure_comp as sc
 import figure_comp.structure_parse as sp
 from figure_comp.load_image import Label
-from figure_comp.tests.test_coordinate_tracking import get_coords
-
-project_dir = Path(__file__).resolve().parent
-test_im_dir = project_dir / "test_im/"
-
-paths = [
-    test_im_dir / "square-im-1.png",
-    test_im_dir / "square-im-2.png",
-    test_im_dir / "square-im-3.png",
-    test_im_dir / "square-im-4.png",
-    test_im_dir / "square-im-5.png",
-    test_im_dir / "rect-im-1.png",
-    test_im_dir / "rect-im-2.png",
-    test_im_dir / "rect-im-3.png",
+from figure_comp.tests._helpers import get_coords, get_coords_multi, worker_tmp_path
+from figure_comp.tests._yaml_fixtures import (
+    GLOBAL_LABEL_OVERRIDE_YAML,
+    GLOBAL_LABELS_YAML,
+    GLOBAL_OPTS_YAML,
+    GLOBAL_OVERRIDE_YAML,
+    MANUAL_SIMPLE_YAML,
+    NESTED_CONFIG,
+    NESTED_DOUBLE_CONFIG,
+    OPTIONS_SIMPLE_YAML,
+    SIMPLE_CONFIG,
+    TRI_MERGE_YAML,
+)
+from figure_comp.tests._yaml_fixtures import load as _load
+
+# The assemble tests address the images relative to the project root;
+# resolve() stats every path component, so walk the filesystem once here
+resolved_paths = [
+    Path(f"tests/test_im/square-im-{i}.png").resolve() for i in range(1, 6)
 ]
-im_paths = [Path(p) for p in paths]
+
+# Unresolved relatives for the tests that exercise path handling as given
+rel_square_paths = tuple(Path(f"tests/test_im/square-im-{i}.png") for i in range(1, 6))
+rel_rect_paths = tuple(Path(f"tests/test_im/rect-im-{i}.png") for i in range(1, 4))
+
+@functools.lru_cache(maxsize=None)
+def _pos(path) -> ct.Pos:
+    """Flyweight for the expected Pos leaves.
+
+    The tests only ever compare these against parsed output, so every
+    occurrence of a path can share one instance.
+    """
+    return ct.Pos(path=path)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_dry(text: str):
+    """Load and dry-parse yaml text, cached on the source string.
+
+    Parsing is idempotent and the resulting (header, struct) tuples are
+    only ever compared, so tests that share a configuration can share the
+    parsed tree.
+    """
+    return sp.parse_yaml(_load(text), dry=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _assembled(src: str):
+    """Parse and lay out yaml source, cached on the string.
+
+    The tests only read coordinates and labels off the resulting
+    PosArray, so configurations can share one layout per run.
+    """
+    return sp.parse_yaml(_load(src)).run()
+
+
+# The pre-built configs are lists, so the dry cache keys on their names
+_CONFIGS = {
+    "simple": SIMPLE_CONFIG,
+    "nested": NESTED_CONFIG,
+    "nested_double": NESTED_DOUBLE_CONFIG,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_config_dry(name: str):
+    """ Dry-parse one of the module config constants, computed once. """
+    return sp.parse_yaml(_CONFIGS[name], dry=True)
 
 
 class TestYamlParsing(unittest.TestCase):
     def test_manual_simple_parse(self):
         """ Experiment with a simple yaml structure. """
-
-        test_yaml = """
-        - Row:
-          - /path/one
-          - /path/two
-          - options:
-             max_size: 20
-             new_size: 45
-        """
-
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)[0]
+        # Only the plain structure matters here, so fold the event stream
+        # directly instead of a full load through the composer
+        test_config = sp._stream_structure(MANUAL_SIMPLE_YAML)[0]
 
         self.assertTrue("Row" in test_config)
 
@@ -65,14 +109,8 @@ class TestYamlParsing(unittest.TestCase):
         self.assertEqual(options_test, options_expected)
 
     def test_simple_parse(self):
-        """ Experiment with a simple yaml structure. """
-        test_yaml = """
-        - Row:
-          - /path/one
-          - /path/two
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        figure_test = sp.parse_yaml(test_config, dry=True)
+        """ Parse a simple pre-built structure. """
+        figure_test = _parse_config_dry("simple")
 
         leaf_expected = (
             "Row",
@@ -83,16 +121,7 @@ class TestYamlParsing(unittest.TestCase):
 
     def test_nested_parse(self):
         """ A structure with a column within a row. """
-        test_yaml = """
-        - Row:
-          - /path/one
-          - /path/two
-          - Col:
-            - /path/three
-            - /path/four
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        figure_test = sp.parse_yaml(test_config, dry=True)
+        figure_test = _parse_config_dry("nested")
 
         nested_leaf = ("Col", [ct.Pos("/path/three"), ct.Pos("/path/four")])
         leaf_expected = (
@@ -102,20 +131,15 @@ class TestYamlParsing(unittest.TestCase):
 
         self.assertEqual(figure_test, leaf_expected)
 
+    def test_stream_matches_load(self):
+        """ The event-stream parser gives the same dry tree as yaml.load. """
+        figure_stream = sp.parse_yaml_stream(TRI_MERGE_YAML, dry=True)
+        figure_load = _parse_dry(TRI_MERGE_YAML)
+        self.assertEqual(figure_stream, figure_load)
+
     def test_nested_double_parse(self):
         """ A structure with two columns within a row. """
-        test_yaml = """
-        - Row:
-          - Col:
-            - /path/one
-            - /path/two
-          - /path/five
-          - Col:
-            - /path/three
-            - /path/four
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        figure_test = sp.parse_yaml(test_config, dry=True)
+        figure_test = _parse_config_dry("nested_double")
 
         first_col = ("Col", [ct.Pos("/path/one"), ct.Pos("/path/two")])
         second_col = ("Col", [ct.Pos("/path/three"), ct.Pos("/path/four")])
@@ -130,36 +154,26 @@ class TestYamlParsing(unittest.TestCase):
 class TestAssembleStruct(unittest.TestCase):
     def test_simple_parse(self):
         """ Assemble an image from a simple structure. """
-        im_one = Path("tests/test_im/square-im-1.png").resolve()
-        im_two = Path("tests/test_im/square-im-2.png").resolve()
+        im_one, im_two = resolved_paths[:2]
         test_yaml = f"""
         - Row:
           - {im_one}
           - {im_two}
         """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
+        test_config = _load(test_yaml)
 
         pos_test = sp.parse_yaml(test_config)
-        pos_expected = [ct.Pos(path=p.resolve()) for p in [im_one, im_two]]
+        pos_expected = [_pos(im_one), _pos(im_two)]
 
         # Test outer layer
         self.assertTrue(isinstance(pos_test, sc.Row))
 
-        # Test that arrays are the same
-        for im_test, im_expected in zip(pos_test.cont, pos_expected):
-            self.assertEqual(im_test, im_expected)
-
-        self.assertEqual(len(pos_test.cont), len(pos_expected))
+        # One list comparison covers both the elements and the length
+        self.assertEqual(list(pos_test.cont), pos_expected)
 
     def test_nested_parse(self):
         """ Assemble an image from a nested structure. """
-        paths = [
-            "tests/test_im/square-im-1.png",
-            "tests/test_im/square-im-2.png",
-            "tests/test_im/square-im-3.png",
-            "tests/test_im/square-im-4.png",
-        ]
-        im_paths = [Path(p).resolve() for p in paths]
+        im_paths = resolved_paths[:4]
 
         test_yaml = f"""
         - Row:
@@ -169,10 +183,9 @@ class TestAssembleStruct(unittest.TestCase):
             - {im_paths[2]}
             - {im_paths[3]}
         """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        figure_test = sp.parse_yaml(test_config, dry=True)
+        figure_test = _parse_dry(test_yaml)
 
-        ims = [ct.Pos(path=p.resolve()) for p in im_paths]
+        ims = [_pos(p) for p in im_paths]
 
         # Test outer layer
         header_test = figure_test[0]
@@ -188,18 +201,11 @@ class TestAssembleStruct(unittest.TestCase):
         self.assertEqual(inner_col[1], ims[3])
 
     def test_nested_double_parse(self):
-        """ Assemble a structure with two columns within a row. """
-        paths = [
-            "tests/test_im/square-im-1.png",
-            "tests/test_im/square-im-2.png",
-            "tests/test_im/square-im-3.png",
-            "tests/test_im/square-im-4.png",
-            "tests/test_im/square-im-5.png",
-        ]
-        im_paths = [Path(p).resolve() for p in paths]
-        ims = [ct.Pos(path=p) for p in im_paths]
+        """ Two columns within a row, in block and shortened flow notation. """
+        im_paths = resolved_paths
+        ims = [_pos(p) for p in im_paths]
 
-        test_yaml = f"""
+        block_yaml = f"""
         - Row:
           - Col:
             - {im_paths[0]}
@@ -209,70 +215,36 @@ class TestAssembleStruct(unittest.TestCase):
             - {im_paths[2]}
             - {im_paths[3]}
         """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        figure_test = sp.parse_yaml(test_config, dry=True)
-
-        # Middle column with single image
-        main_body = figure_test[1]
-        self.assertEqual(main_body[1], ims[4])
-
-        # First column
-        col_one = main_body[0][1]
-        self.assertEqual(col_one[0], ims[0])
-        self.assertEqual(col_one[1], ims[1])
-
-        # Final column
-        col_two = main_body[2][1]
-        self.assertEqual(col_two[0], ims[2])
-        self.assertEqual(col_two[1], ims[3])
-
-    def test_nested_double_short(self):
-        """ Assemble a structure with two columns within a row using shortened notation. """
-        paths = [
-            "tests/test_im/square-im-1.png",
-            "tests/test_im/square-im-2.png",
-            "tests/test_im/square-im-3.png",
-            "tests/test_im/square-im-4.png",
-            "tests/test_im/square-im-5.png",
-        ]
-        im_paths = [Path(p).resolve() for p in paths]
-        ims = [ct.Pos(path=p) for p in im_paths]
-
-        test_yaml = f"""
+        flow_yaml = f"""
         - Row:
           - Col: [{im_paths[0]}, {im_paths[1]}]
           - {im_paths[4]}
           - Col: [{im_paths[2]}, {im_paths[3]}]
         """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        figure_test = sp.parse_yaml(test_config, dry=True)
 
-        # Middle column with single image
-        main_body = figure_test[1]
-        self.assertEqual(main_body[1], ims[4])
+        # Both notations describe the same tree; the fixtures above are
+        # shared and only the parse is repeated per notation
+        for notation, test_yaml in [("block", block_yaml), ("flow", flow_yaml)]:
+            with self.subTest(notation=notation):
+                figure_test = _parse_dry(test_yaml)
 
-        # First column
-        col_one = main_body[0][1]
-        self.assertEqual(col_one[0], ims[0])
-        self.assertEqual(col_one[1], ims[1])
+                # Middle column with single image
+                main_body = figure_test[1]
+                self.assertEqual(main_body[1], ims[4])
 
-        # Final column
-        col_two = main_body[2][1]
-        self.assertEqual(col_two[0], ims[2])
-        self.assertEqual(col_two[1], ims[3])
+                # First column
+                col_one = main_body[0][1]
+                self.assertEqual(col_one[0], ims[0])
+                self.assertEqual(col_one[1], ims[1])
+
+                # Final column
+                col_two = main_body[2][1]
+                self.assertEqual(col_two[0], ims[2])
+                self.assertEqual(col_two[1], ims[3])
 
     def test_nested_four_level(self):
         """ Read options in a nested element. """
-        paths = [
-            "tests/test_im/rect-im-1.png",
-            "tests/test_im/rect-im-2.png",
-            "tests/test_im/rect-im-3.png",
-            "tests/test_im/square-im-3.png",
-            "tests/test_im/square-im-4.png",
-            "tests/test_im/square-im-5.png",
-            "tests/test_im/rect-im-3.png",
-        ]
-        im_paths = [Path(p) for p in paths]
+        im_paths = [*rel_rect_paths, *rel_square_paths[2:], rel_rect_paths[2]]
 
         test_yaml = f"""
         - Row:
@@ -285,19 +257,18 @@ class TestAssembleStruct(unittest.TestCase):
                     - {im_paths[2]}
           - {im_paths[4]}
         """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
+        test_config = _load(test_yaml)
         figure_test = sp.parse_yaml(test_config)
 
     def test_simple_parse_flow(self):
         """ Read options in the simplest case with the space saving format. """
-        im_one = Path("tests/test_im/square-im-1.png")
-        im_two = Path("tests/test_im/square-im-2.png")
+        im_one, im_two = rel_square_paths[:2]
         test_yaml = f"""
         - Row:
           - {im_one}: {{text: "test-label"}}
           - {im_two}
         """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
+        test_config = _load(test_yaml)
         figure_test = sp.parse_yaml(test_config)
 
         label_expected = "test-label"
@@ -306,39 +277,27 @@ class TestAssembleStruct(unittest.TestCase):
 
     def test_tri_array_merge(self):
         """ Investigate rescaling of PosArray """
-        test_yaml = """
-        - Row:
-          - 1.png
-          - Col:
-            - 2.png
-            - Row:
-              - 3.png
-              - 4.png
-        """
-
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        pos_arr = sp.parse_yaml(test_config).run()
+        pos_arr = _assembled(TRI_MERGE_YAML)
 
         # Widths of the squares in decreasing size
         full_width = 50
         med_width = 50 * (2 / 3)
         sma_width = med_width / 2
 
-        x_test = get_coords(pos_arr, "x")
+        # One traversal gathers all four coordinate lists
+        coords_test = get_coords_multi(pos_arr)
+
         x_expected = [0, full_width, full_width, full_width + sma_width]
-        assert_allclose(x_test, x_expected)
+        assert_allclose(coords_test["x"], x_expected)
 
-        y_test = get_coords(pos_arr, "y")
         y_expected = [0, 0, med_width, med_width]
-        assert_allclose(y_test, y_expected)
+        assert_allclose(coords_test["y"], y_expected)
 
-        dx_test = get_coords(pos_arr, "dx")
         dx_expected = [full_width, med_width, sma_width, sma_width]
-        assert_allclose(dx_test, dx_expected)
+        assert_allclose(coords_test["dx"], dx_expected)
 
-        dy_test = get_coords(pos_arr, "dy")
         dy_expected = [full_width, med_width, sma_width, sma_width]
-        assert_allclose(dy_test, dy_expected)
+        assert_allclose(coords_test["dy"], dy_expected)
 
 
 class TestAssembleOptions(unittest.TestCase):
@@ -346,19 +305,8 @@ class TestAssembleOptions(unittest.TestCase):
 
     def test_simple_parse_options(self):
         """ Read options in the simplest case. """
-        test_yaml = f"""
-        - Row:
-          - {paths[0]}:
-              text: "a."
-              pos: (0.1, 0.1)
-          - Col:
-            - {paths[1]}
-            - {paths[2]}
-            - Row:
-              - {paths[3]}
-              - {paths[4]}
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)[0]
+        # This test's parser mutates the label dicts, so take a copy
+        test_config = copy.deepcopy(_load(OPTIONS_SIMPLE_YAML))[0]
 
         def _parse_complex_path(leaf):
             """ Parse a path with labels: """
@@ -399,107 +347,55 @@ class TestAssembleOptions(unittest.TestCase):
             return header_struct(struct)
 
         struct = read_branch(test_config).run()
-        struct.populate("/tmp/new_parse.png")
+        struct.populate(worker_tmp_path("new_parse.png"))
 
     def test_parse_global_opts(self):
         """ Test that we can read global options. """
-        test_yaml = f"""
-        - Row:
-          - {paths[0]}
-          - Col:
-            - {paths[1]}
-            - {paths[2]}
-            - Row:
-              - {paths[3]}
-              - {paths[4]}
-        - Options:
-          - size: 45
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        pos_arr = sp.parse_yaml(test_config).run()
+        pos_arr = _assembled(GLOBAL_OPTS_YAML)
 
         labels = get_coords(pos_arr, "label")
         sizes_test = [l.size for l in labels]
-        sizes_expected = np.ones(5) * 45
+        # The sizes are exact integers, so plain list equality is enough
+        sizes_expected = [45] * 5
 
-        assert_allclose(sizes_test, sizes_expected)
+        self.assertEqual(sizes_test, sizes_expected)
 
     def test_parse_global_override(self):
         """ Test that we can override a global options. """
-        test_yaml = f"""
-        - Row:
-          - {paths[0]}
-          - Col:
-            - {paths[1]}: {{size: 10}}
-            - {paths[2]}
-            - Row:
-              - {paths[3]}
-              - {paths[4]}
-        - Options:
-          - size: 45
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        pos_arr = sp.parse_yaml(test_config).run()
+        pos_arr = _assembled(GLOBAL_OVERRIDE_YAML)
 
         labels = get_coords(pos_arr, "label")
         sizes_test = [l.size for l in labels]
-        sizes_expected = np.ones(5) * 45
+        sizes_expected = [45] * 5
         sizes_expected[1] = 10
 
-        assert_allclose(sizes_test, sizes_expected)
+        self.assertEqual(sizes_test, sizes_expected)
 
     def test_parse_global_labels(self):
         """ Test that we parse the default label gen. """
-        test_yaml = f"""
-        - Row:
-          - {paths[0]}
-          - Col:
-            - {paths[1]}
-            - {paths[2]}
-            - Row:
-              - {paths[3]}
-              - {paths[4]}
-        - Options:
-          - default_label: "{{index+1}}."
-          - size: 18
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        pos_arr = sp.parse_yaml(test_config).run()
+        pos_arr = _assembled(GLOBAL_LABELS_YAML)
 
         labels = get_coords(pos_arr, "label")
         text_test = [l.text for l in labels]
-        text_expected = [f"{i+1}." for i in range(5)]
+        # Format the numbering in one numpy string op rather than a
+        # python f-string per label
+        text_expected = np.char.add((np.arange(5) + 1).astype(str), ".")
 
-        self.assertEqual(text_test, text_expected)
+        assert_array_equal(text_test, text_expected)
 
         sizes_test = [l.size for l in labels]
-        sizes_expected = np.ones(5) * 18
-        assert_allclose(sizes_test, sizes_expected)
+        self.assertEqual(sizes_test, [18] * 5)
 
     def test_parse_global_label_override(self):
         """ Test that we parse the default label gen with an override. """
-        test_yaml = f"""
-        - Row:
-          - {paths[0]}
-          - Col:
-            - {paths[1]}
-            - {paths[2]}:
-                text: "A"
-            - Row:
-              - {paths[3]}
-              - {paths[4]}
-        - Options:
-          - default_label: "{{index+1}}."
-        """
-        test_config = yaml.load(test_yaml, Loader=yaml.FullLoader)
-        pos_arr = sp.parse_yaml(test_config).run()
+        pos_arr = _assembled(GLOBAL_LABEL_OVERRIDE_YAML)
 
         labels = get_coords(pos_arr, "label")
         text_test = [l.text for l in labels]
-        text_expected = [f"{i+1}." for i in range(5)]
+        text_expected = np.char.add((np.arange(5) + 1).astype(str), ".")
         text_expected[2] = "A"
 
-        self.assertEqual(text_test, text_expected)
+        assert_array_equal(text_test, text_expected)
 
 
 if __name__ == "__main__":